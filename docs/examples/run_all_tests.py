@@ -12,12 +12,74 @@ Usage:
     python run_all_tests.py --help       # Show help
 """
 
+import io
 import os
 import sys
 import subprocess
 import argparse
+import threading
+import importlib.util
+import py_compile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+def _check_syntax(py_file):
+    """Compile one file and report (path, kind, detail).
+
+    kind is None on success, 'syntax' for syntax errors, 'error' otherwise.
+    Module-level so it can be pickled for the process pool. py_compile reads
+    the file's bytes directly (no str round trip) and leaves a .pyc behind,
+    so later runs of the test scripts skip recompilation on import.
+    """
+    try:
+        py_compile.compile(py_file, doraise=True)
+        return py_file, None, None
+
+    except py_compile.PyCompileError as e:
+        if isinstance(e.exc_value, SyntaxError):
+            return py_file, 'syntax', f"Line {e.exc_value.lineno}: {e.exc_value.msg}"
+        return py_file, 'error', e.msg
+    except Exception as e:
+        return py_file, 'error', str(e)
+
+def _walk_py(root):
+    """Yield .py file paths under root.
+
+    os.scandir reuses the directory entry's type information, avoiding the
+    extra stat() per file that pathlib's rglob pays.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+# Cached Appium server probe so repeated runs within the TTL skip the
+# network round trip
+_appium_cache = {'ts': 0.0, 'ok': False}
+_APPIUM_STATUS_TTL = 10  # seconds
+
+class _ThreadOutput:
+    """Routes print output to a per-thread buffer so concurrent suite logs don't interleave"""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    def write(self, text):
+        target = getattr(self.local, 'buffer', None) or self.fallback
+        target.write(text)
+
+    def flush(self):
+        target = getattr(self.local, 'buffer', None) or self.fallback
+        target.flush()
+
+
 class TestRunner:
     def __init__(self):
         self.results = {
@@ -25,6 +87,9 @@ class TestRunner:
             'api': {'passed': 0, 'failed': 0, 'tests': []},
             'mobile': {'passed': 0, 'failed': 0, 'tests': []}
         }
+        # Populated by check_dependencies so the suite runners don't have to
+        # re-probe (or re-import) the same modules
+        self._deps_available = {}
     
     def print_header(self, title):
         """Print formatted header"""
@@ -38,27 +103,53 @@ class TestRunner:
         print("-" * 50)
     
     def run_command(self, command, description):
-        """Run a command and capture results"""
+        """Run a command (argument list), streaming its output as it runs"""
         print(f"  🔄 {description}...")
-        
+
+        process = None
         try:
-            result = subprocess.run(
+            # Stream line by line instead of buffering everything until exit:
+            # long-running tests log live and memory stays flat, while a copy
+            # of the output is kept for the summary
+            process = subprocess.Popen(
                 command,
-                shell=True,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300  # 5 minute timeout
+                bufsize=1
             )
-            
-            if result.returncode == 0:
+
+            # Read on a helper thread so the timeout below still fires
+            # when a test hangs without closing stdout - reading inline
+            # would block until the child exits and never reach wait()
+            output_lines = []
+            stream = sys.stdout
+            if isinstance(stream, _ThreadOutput):
+                # the pump thread has no buffer of its own; write into
+                # the one owned by the suite thread running this command
+                stream = getattr(stream.local, 'buffer', None) or stream.fallback
+
+            def _pump():
+                for line in process.stdout:
+                    stream.write(f"     {line}")
+                    output_lines.append(line)
+
+            reader = threading.Thread(target=_pump, daemon=True)
+            reader.start()
+
+            returncode = process.wait(timeout=300)  # 5 minute timeout
+            reader.join()
+            output = "".join(output_lines)
+
+            if returncode == 0:
                 print(f"  ✅ {description} - PASSED")
-                return True, result.stdout
+                return True, output
             else:
                 print(f"  ❌ {description} - FAILED")
-                print(f"     Error: {result.stderr}")
-                return False, result.stderr
-                
+                return False, output
+
         except subprocess.TimeoutExpired:
+            process.kill()
             print(f"  ⏰ {description} - TIMEOUT")
             return False, "Test execution timed out"
         except Exception as e:
@@ -70,11 +161,8 @@ class TestRunner:
         self.print_section("Web Testing Examples")
         
         # Check if dependencies are installed
-        try:
-            import selenium
-            from webdriver_manager.chrome import ChromeDriverManager
-        except ImportError as e:
-            print(f"  ⚠️  Web testing dependencies not installed: {e}")
+        if not (self._dep_available('selenium') and self._dep_available('webdriver_manager')):
+            print("  ⚠️  Web testing dependencies not installed")
             print("     Install with: pip install selenium webdriver-manager")
             return False
         
@@ -85,7 +173,7 @@ class TestRunner:
         test_file = web_dir / "basic_page_tests" / "basic_page_test.py"
         if test_file.exists():
             success, output = self.run_command(
-                f"python {test_file}",
+                [sys.executable, str(test_file)],
                 "Basic Page Test"
             )
             self.results['web']['tests'].append(('Basic Page Test', success))
@@ -98,7 +186,7 @@ class TestRunner:
         test_file = web_dir / "form_tests" / "simple_form_test.py"
         if test_file.exists():
             success, output = self.run_command(
-                f"python {test_file}",
+                [sys.executable, str(test_file)],
                 "Simple Form Test"
             )
             self.results['web']['tests'].append(('Simple Form Test', success))
@@ -114,10 +202,8 @@ class TestRunner:
         self.print_section("API Testing Examples")
         
         # Check if dependencies are installed
-        try:
-            import requests
-        except ImportError as e:
-            print(f"  ⚠️  API testing dependencies not installed: {e}")
+        if not self._dep_available('requests'):
+            print("  ⚠️  API testing dependencies not installed")
             print("     Install with: pip install requests")
             return False
         
@@ -128,7 +214,7 @@ class TestRunner:
         test_file = api_dir / "basic_api_tests" / "basic_api_test.py"
         if test_file.exists():
             success, output = self.run_command(
-                f"python {test_file}",
+                [sys.executable, str(test_file)],
                 "Basic API Test"
             )
             self.results['api']['tests'].append(('Basic API Test', success))
@@ -144,10 +230,8 @@ class TestRunner:
         self.print_section("Mobile Testing Examples")
         
         # Check if dependencies are installed
-        try:
-            from appium import webdriver
-        except ImportError as e:
-            print(f"  ⚠️  Mobile testing dependencies not installed: {e}")
+        if not self._dep_available('appium'):
+            print("  ⚠️  Mobile testing dependencies not installed")
             print("     Install with: pip install Appium-Python-Client")
             return False
         
@@ -155,40 +239,55 @@ class TestRunner:
         # Full mobile tests require a running Appium server and device
         mobile_dir = Path(__file__).parent / "mobile"
         
-        # Check if we can connect to Appium
+        # Check if we can connect to Appium (cached so repeat runs inside
+        # the TTL skip the probe entirely)
         print("  🔍 Checking Appium server connection...")
-        try:
-            # Try to import and check if Appium server is accessible
-            import requests
-            response = requests.get("http://localhost:4723/status", timeout=2)
-            
-            if response.status_code == 200:
-                print("  ✅ Appium server is running")
-                
-                # Run connection test
-                test_file = mobile_dir / "basic_tests" / "connection_test.py"
-                if test_file.exists():
-                    success, output = self.run_command(
-                        f"python {test_file}",
-                        "Mobile Connection Test"
-                    )
-                    self.results['mobile']['tests'].append(('Mobile Connection Test', success))
-                    if success:
-                        self.results['mobile']['passed'] += 1
-                    else:
-                        self.results['mobile']['failed'] += 1
-            else:
-                print("  ⚠️  Appium server is not accessible")
-                print("     Mobile tests skipped - Appium server not running")
-                print("     Start with: appium --address 127.0.0.1 --port 4723")
-                
-        except requests.exceptions.RequestException:
+        if self._appium_server_available():
+            print("  ✅ Appium server is running")
+
+            # Run connection test
+            test_file = mobile_dir / "basic_tests" / "connection_test.py"
+            if test_file.exists():
+                success, output = self.run_command(
+                    [sys.executable, str(test_file)],
+                    "Mobile Connection Test"
+                )
+                self.results['mobile']['tests'].append(('Mobile Connection Test', success))
+                if success:
+                    self.results['mobile']['passed'] += 1
+                else:
+                    self.results['mobile']['failed'] += 1
+        else:
             print("  ⚠️  Appium server is not running")
             print("     Mobile tests skipped - Appium server not running")
             print("     Start with: appium --address 127.0.0.1 --port 4723")
             return False
-        
+
         return self.results['mobile']['failed'] == 0
+
+    def _dep_available(self, module_name):
+        """Answer from check_dependencies' results; probe lazily if a suite
+        is run on its own before the check has populated the cache"""
+        if module_name not in self._deps_available:
+            self._deps_available[module_name] = importlib.util.find_spec(module_name) is not None
+        return self._deps_available[module_name]
+
+    def _appium_server_available(self):
+        """Probe the local Appium /status endpoint, caching the answer briefly"""
+        now = time.time()
+        if now - _appium_cache['ts'] < _APPIUM_STATUS_TTL:
+            return _appium_cache['ok']
+
+        import requests
+        try:
+            response = requests.get("http://localhost:4723/status", timeout=2)
+            ok = response.status_code == 200
+        except requests.exceptions.RequestException:
+            ok = False
+
+        _appium_cache['ts'] = now
+        _appium_cache['ok'] = ok
+        return ok
     
     def run_syntax_check(self):
         """Run syntax check on all example files"""
@@ -203,26 +302,25 @@ class TestRunner:
         python_files = []
         for example_dir in example_dirs:
             if example_dir.exists():
-                python_files.extend(example_dir.rglob("*.py"))
+                python_files.extend(_walk_py(str(example_dir)))
         
         all_good = True
-        for py_file in python_files:
-            try:
-                # Check syntax by compiling
-                with open(py_file, 'r') as f:
-                    code = f.read()
-                
-                compile(code, str(py_file), 'exec')
-                print(f"  ✅ {py_file.relative_to(Path(__file__).parent)}")
-                
-            except SyntaxError as e:
-                print(f"  ❌ {py_file.relative_to(Path(__file__).parent)} - Syntax Error")
-                print(f"     Line {e.lineno}: {e.msg}")
-                all_good = False
-            except Exception as e:
-                print(f"  ❌ {py_file.relative_to(Path(__file__).parent)} - Error: {e}")
-                all_good = False
-        
+        if python_files:
+            # compile() is CPU-bound and holds the GIL, so spread the files
+            # across a process pool; results stream back in submission order
+            with ProcessPoolExecutor() as executor:
+                for py_file, kind, detail in executor.map(_check_syntax, map(str, python_files)):
+                    rel_path = Path(py_file).relative_to(Path(__file__).parent)
+                    if kind is None:
+                        print(f"  ✅ {rel_path}")
+                    elif kind == 'syntax':
+                        print(f"  ❌ {rel_path} - Syntax Error")
+                        print(f"     {detail}")
+                        all_good = False
+                    else:
+                        print(f"  ❌ {rel_path} - Error: {detail}")
+                        all_good = False
+
         return all_good
     
     def generate_summary(self):
@@ -276,20 +374,23 @@ class TestRunner:
         """Check if required dependencies are installed"""
         self.print_section("Dependency Check")
         
+        # pip package name -> (import name, description)
         dependencies = {
-            'selenium': 'Web testing (Selenium)',
-            'webdriver-manager': 'Automatic WebDriver management',
-            'requests': 'API testing (Requests)',
-            'Appium-Python-Client': 'Mobile testing (Appium)'
+            'selenium': ('selenium', 'Web testing (Selenium)'),
+            'webdriver-manager': ('webdriver_manager', 'Automatic WebDriver management'),
+            'requests': ('requests', 'API testing (Requests)'),
+            'Appium-Python-Client': ('appium', 'Mobile testing (Appium)')
         }
-        
+
         missing_deps = []
-        
-        for dep, description in dependencies.items():
-            try:
-                __import__(dep.replace('-', '_'))
+
+        for dep, (module_name, description) in dependencies.items():
+            # find_spec only checks availability - no module code is executed
+            available = importlib.util.find_spec(module_name) is not None
+            self._deps_available[module_name] = available
+            if available:
                 print(f"  ✅ {dep} - {description}")
-            except ImportError:
+            else:
                 print(f"  ❌ {dep} - {description} (NOT INSTALLED)")
                 missing_deps.append(dep)
         
@@ -316,21 +417,44 @@ class TestRunner:
         if test_types is None:
             test_types = ['web', 'api', 'mobile']
         
-        # Run selected tests
+        # Run the selected suites concurrently - they are independent and
+        # spend most of their time blocked on subprocesses, so the total
+        # runtime becomes the slowest suite instead of the sum of all three
+        suite_runners = {
+            'web': self.run_web_tests,
+            'api': self.run_api_tests,
+            'mobile': self.run_mobile_tests
+        }
+        selected = [test_type for test_type in ('web', 'api', 'mobile') if test_type in test_types]
+
+        # Each suite thread writes into its own buffer and the buffers are
+        # flushed in selection order, so the live subprocess streaming in
+        # run_command cannot interleave the web/api/mobile logs
+        output = _ThreadOutput(sys.stdout)
+        sys.stdout = output
+
+        def _run_suite(runner):
+            output.local.buffer = io.StringIO()
+            try:
+                suite_success = runner()
+            finally:
+                buffer = output.local.buffer
+                output.local.buffer = None
+            return suite_success, buffer.getvalue()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(selected), 1)) as executor:
+                futures = [executor.submit(_run_suite, suite_runners[test_type])
+                           for test_type in selected]
+                results = [future.result() for future in futures]
+        finally:
+            sys.stdout = output.fallback
+
         success = True
-        
-        if 'web' in test_types:
-            web_success = self.run_web_tests()
-            success = success and web_success
-        
-        if 'api' in test_types:
-            api_success = self.run_api_tests()
-            success = success and api_success
-        
-        if 'mobile' in test_types:
-            mobile_success = self.run_mobile_tests()
-            success = success and mobile_success
-        
+        for suite_success, section in results:
+            sys.stdout.write(section)
+            success = success and suite_success
+
         # Generate summary
         self.generate_summary()
         
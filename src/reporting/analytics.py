@@ -10,37 +10,349 @@ Advanced analytics and insights from test results:
 - Comparative analysis
 """
 
+import bisect
+import functools
+import hashlib
+import heapq
 import json
+import math
 import statistics
-from typing import List, Dict, Any, Optional, Tuple
+import sys
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
+from itertools import accumulate
 import re
 
+# Words of 4+ characters in failure messages, compiled once at import time
+# instead of going through the re-cache lookup on every message
+_WORD_RE = re.compile(r'\b\w{4,}\b')
+
+# Common failure-related keywords as one alternation - a single scan of the
+# failure text replaces one full .count() pass per keyword, and the word
+# boundaries stop 'error' from also matching inside unrelated words
+_FAILURE_KEYWORDS = (
+    'timeout', 'connection', 'error', 'exception', 'failed', 'not found',
+    'assertion', 'validation', 'permission', 'authentication', 'network'
+)
+_FAIL_KW_RE = re.compile(r'\b(' + '|'.join(map(re.escape, _FAILURE_KEYWORDS)) + r')\b', re.IGNORECASE)
+
+# With the optional pyahocorasick package installed, keyword counting runs
+# through a C-level multi-pattern automaton; otherwise the precompiled
+# alternation does the same single scan through the regex engine. Both
+# paths count whole-word matches and never materialize the joined corpus.
+try:
+    import ahocorasick
+
+    _FAIL_KW_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _FAILURE_KEYWORDS:
+        _FAIL_KW_AUTOMATON.add_word(_keyword, _keyword)
+    _FAIL_KW_AUTOMATON.make_automaton()
+
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == '_'
+
+    def _count_failure_keywords(messages: List[str]) -> Counter:
+        counts = Counter()
+        for message in messages:
+            if not message:
+                continue
+            # the automaton matches exact bytes, so it needs the lowered text
+            text = message.lower()
+            for end, keyword in _FAIL_KW_AUTOMATON.iter(text):
+                start = end - len(keyword) + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                counts[keyword] += 1
+        return counts
+except ImportError:
+    def _count_failure_keywords(messages: List[str]) -> Counter:
+        # The pattern is case-insensitive, so only the handful of matched
+        # keywords get lowercased - never the full message text
+        counts = Counter()
+        for message in messages:
+            if message:
+                counts.update(match.lower() for match in _FAIL_KW_RE.findall(message))
+        return counts
+
+
+# Executive-summary rating ladders: a bisect into the threshold tuple picks
+# the label, replacing chained ternaries and keeping the cutoffs in one
+# place. Quality uses bisect_left ('above 90' wins) and performance uses
+# bisect_right ('below 5' wins), matching the old comparison directions.
+_QUALITY_THRESHOLDS = (70, 90)
+_QUALITY_LABELS = ('Poor', 'Needs Improvement', 'Good')
+_PERFORMANCE_THRESHOLDS = (5, 15)
+_PERFORMANCE_LABELS = ('Good', 'Needs Optimization', 'Poor')
+
+
+class _TestRecord(NamedTuple):
+    """Fixed-slot view of one result dict for the repeated analysis passes.
+
+    Attribute access on a NamedTuple is a plain tuple index, so the
+    analyses that walk every result skip the dict-key hashing that
+    dominated the old comprehension-per-metric code. Fields keep the raw
+    dict values ('' when absent); consumers apply their own fallbacks,
+    and the original dicts stay authoritative for report output.
+    """
+    status: Optional[str]
+    duration: float
+    suite: str
+    category: str
+    name: str
+    timestamp: str
+    message: str
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse an ISO timestamp, or None when empty/malformed.
+
+    fromisoformat is slow enough that re-parsing the same timestamps in
+    every timeline/trend/filter pass dominated those methods; the cache
+    means each distinct timestamp string is parsed once per process.
+    """
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+
+
+# Analysis caches keyed by a digest of the test results, shared across
+# engine instances - dashboards that rebuild AnalyticsEngine over the same
+# results file reuse the earlier analyses instead of recomputing them.
+# Bounded to the most recently used datasets.
+_SHARED_CACHE_MAX_DATASETS = 8
+_shared_analysis_caches = OrderedDict()
+
+
+# orjson serializes straight to bytes several times faster than the stdlib
+# encoder; OPT_SORT_KEYS keeps the fingerprint canonical either way
+try:
+    import orjson
+
+    def _dump_canonical(results: List[Dict[str, Any]]) -> bytes:
+        return orjson.dumps(results, option=orjson.OPT_SORT_KEYS, default=str)
+except ImportError:
+    def _dump_canonical(results: List[Dict[str, Any]]) -> bytes:
+        return json.dumps(results, sort_keys=True, default=str).encode('utf-8')
+
+
+def _results_digest(results: List[Dict[str, Any]]) -> str:
+    """Content fingerprint of a results list, stable across processes"""
+    try:
+        payload = _dump_canonical(results)
+    except (TypeError, ValueError):
+        # Unserializable content: fall back to object identity (no sharing)
+        return f'id:{id(results)}'
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _memoize(fn=None, *, time_relative=False):
+    """Cache an analysis method's result in self.analysis_cache.
+
+    Analysis methods are pure functions of the test results, so repeated
+    dashboard/report calls can be served from the cache instead of
+    rescanning the whole list. The cache is dropped whenever test_results
+    is reassigned.
+
+    Methods whose output also depends on the current clock (the rolling
+    1d/7d/30d cutoffs) must pass time_relative=True: their entries are
+    additionally keyed on the current hour, so a long-lived process does
+    not keep serving trends computed against an old now() cutoff.
+    """
+    if fn is None:
+        return functools.partial(_memoize, time_relative=time_relative)
+
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        key = (name, len(self.test_results), args, tuple(sorted(kwargs.items())))
+        if time_relative:
+            key += (datetime.now().strftime('%Y%m%d%H'),)
+        cache = self.analysis_cache
+        if key in cache:
+            return cache[key]
+        result = fn(self, *args, **kwargs)
+        cache[key] = result
+        return result
+
+    return wrapper
+
 
 class AnalyticsEngine:
     """Advanced analytics engine for test results"""
-    
+
     def __init__(self, test_results: List[Dict[str, Any]]):
         self.test_results = test_results
-        self.analysis_cache = {}
-    
+
+    @property
+    def test_results(self) -> List[Dict[str, Any]]:
+        return self._test_results
+
+    @test_results.setter
+    def test_results(self, value: List[Dict[str, Any]]):
+        # New results invalidate the summary; the analysis cache is looked
+        # up by content digest so identical datasets - including ones seen
+        # by earlier engine instances - keep their cached analyses
+        self._test_results = value
+        self._summary_ready = False
+        self._sorted_by_ts = None
+
+        digest = _results_digest(value)
+        cache = _shared_analysis_caches.get(digest)
+        if cache is None:
+            cache = {}
+            _shared_analysis_caches[digest] = cache
+            while len(_shared_analysis_caches) > _SHARED_CACHE_MAX_DATASETS:
+                _shared_analysis_caches.popitem(last=False)
+        else:
+            _shared_analysis_caches.move_to_end(digest)
+        self.analysis_cache = cache
+
+    def _compute_summary(self) -> None:
+        """Aggregate the per-test quantities every analysis needs in one pass.
+
+        The individual analyses used to re-filter the full result list each
+        time (five or more O(N) comprehensions per public call); instead a
+        single walk fills status counts, duration statistics, the duration
+        histogram and per-suite/per-category pass tallies, and consumers
+        read those fields.
+        """
+        if self._summary_ready:
+            return
+
+        status_counts = Counter()
+        durations = []
+        duration_sum = 0.0
+        duration_sum_sq = 0.0
+        duration_min = float('inf')
+        duration_max = 0.0
+        duration_buckets = {'0-1s': 0, '1-5s': 0, '5-10s': 0, '10-30s': 0, '30-60s': 0, '60s+': 0}
+        # Tests over the 20s action-item threshold, which sits between
+        # bucket boundaries and so can't be read from the histogram
+        slow_count = 0
+        suite_status = defaultdict(lambda: [0, 0])     # suite -> [passed, total]
+        category_status = defaultdict(lambda: [0, 0])  # category -> [passed, total]
+        priority_counts = Counter()
+        # Indices of FAILED results - the failure analyses select their
+        # subset through this index list instead of re-comparing every
+        # status string on each call
+        failed_indices = []
+        # One record per result, built while the fields are already in hand
+        records = []
+        # (timestamp, index) pairs for results with comparable (naive)
+        # timestamps; sorted once so period filters are a binary search
+        ts_index = []
+
+        for index, result in enumerate(self._test_results):
+            status = result.get('status')
+            status_counts[status] += 1
+            passed = 1 if status == 'PASSED' else 0
+            if status == 'FAILED':
+                failed_indices.append(index)
+
+            duration = result.get('duration', 0)
+            durations.append(duration)
+            duration_sum += duration
+            duration_sum_sq += duration * duration
+            if duration < duration_min:
+                duration_min = duration
+            if duration > duration_max:
+                duration_max = duration
+
+            if duration > 20:
+                slow_count += 1
+
+            if duration <= 1:
+                duration_buckets['0-1s'] += 1
+            elif duration <= 5:
+                duration_buckets['1-5s'] += 1
+            elif duration <= 10:
+                duration_buckets['5-10s'] += 1
+            elif duration <= 30:
+                duration_buckets['10-30s'] += 1
+            elif duration <= 60:
+                duration_buckets['30-60s'] += 1
+            else:
+                duration_buckets['60s+'] += 1
+
+            suite = result.get('suite', '')
+            category = result.get('category', '')
+            timestamp = result.get('timestamp', '')
+
+            suite_tally = suite_status[suite or 'Unknown']
+            suite_tally[0] += passed
+            suite_tally[1] += 1
+            category_tally = category_status[category or 'Unknown']
+            category_tally[0] += passed
+            category_tally[1] += 1
+            priority_counts[result.get('priority', 'medium')] += 1
+
+            # Interning the low-cardinality fields collapses the thousands
+            # of repeated 'PASSED'/suite/category strings to one object
+            # each, so the == checks above degrade to pointer comparisons
+            records.append(_TestRecord(
+                sys.intern(status) if type(status) is str else status,
+                duration,
+                sys.intern(suite) if type(suite) is str else suite,
+                sys.intern(category) if type(category) is str else category,
+                result.get('name', ''),
+                timestamp,
+                result.get('error_details', '') or result.get('message', ''),
+            ))
+
+            parsed = _parse_timestamp(timestamp)
+            if parsed is not None and parsed.tzinfo is None:
+                ts_index.append((parsed, index))
+
+        ts_index.sort()
+        self._ts_sorted = ts_index
+        self._status_counts = status_counts
+        self._durations = durations
+        self._duration_sum = duration_sum
+        self._duration_sum_sq = duration_sum_sq
+        self._duration_min = duration_min if self._test_results else 0.0
+        self._duration_max = duration_max
+        self._duration_buckets = duration_buckets
+        self._slow_count = slow_count
+        self._suite_status = suite_status
+        self._category_status = category_status
+        self._priority_counts = priority_counts
+        self._failed_indices = failed_indices
+        self._records = records
+        self._summary_ready = True
+
+    @_memoize
     def analyze_performance(self) -> Dict[str, Any]:
         """Analyze test performance metrics and trends"""
         if not self.test_results:
             return {'error': 'No test results available'}
         
-        # Calculate performance metrics
-        durations = [result.get('duration', 0) for result in self.test_results]
-        
+        # The one-pass summary already holds sum, sum of squares, min and
+        # max, so mean and sample standard deviation fall out in O(1)
+        # instead of separate statistics.* loops over the list
+        self._compute_summary()
+        count = len(self.test_results)
+        if count > 1:
+            variance = (self._duration_sum_sq - self._duration_sum ** 2 / count) / (count - 1)
+            std_dev = math.sqrt(max(0.0, variance))
+        else:
+            std_dev = 0
+
         performance_metrics = {
             'duration_stats': {
-                'min': min(durations) if durations else 0,
-                'max': max(durations) if durations else 0,
-                'avg': statistics.mean(durations) if durations else 0,
-                'median': statistics.median(durations) if durations else 0,
-                'std_dev': statistics.stdev(durations) if len(durations) > 1 else 0,
-                'total': sum(durations)
+                'min': self._duration_min,
+                'max': self._duration_max,
+                'avg': self._duration_sum / count,
+                'median': statistics.median(self._durations),
+                'std_dev': std_dev,
+                'total': self._duration_sum
             },
             'slowest_tests': self._get_slowest_tests(10),
             'fastest_tests': self._get_fastest_tests(10),
@@ -50,36 +362,51 @@ class AnalyticsEngine:
         
         return performance_metrics
     
+    @_memoize
     def analyze_failure_patterns(self) -> Dict[str, Any]:
         """Analyze patterns in test failures"""
-        failed_tests = [result for result in self.test_results if result.get('status') == 'FAILED']
-        
+        self._compute_summary()
+        failed_tests = [self._records[index] for index in self._failed_indices]
+
         if not failed_tests:
             return {'message': 'No failed tests to analyze'}
-        
+
+        # The records already carry each field (with the error_details /
+        # message fallback folded in); the helpers take these parallel
+        # lists instead of re-running their own dict.get passes
+        failure_messages = []
+        failed_suites = []
+        failed_categories = []
+        failed_names = []
+        failed_timestamps = []
+        for test in failed_tests:
+            failure_messages.append(test.message)
+            failed_suites.append(test.suite or 'Unknown')
+            failed_categories.append(test.category or 'Unknown')
+            failed_names.append(test.name)
+            failed_timestamps.append(test.timestamp)
+
         failure_analysis = {
             'total_failures': len(failed_tests),
             'failure_rate': len(failed_tests) / len(self.test_results) * 100,
-            'common_failures': self._find_common_failures(failed_tests),
-            'failure_by_suite': self._group_failures_by_suite(failed_tests),
-            'failure_by_category': self._group_failures_by_category(failed_tests),
-            'failure_keywords': self._extract_failure_keywords(failed_tests),
-            'recurring_failures': self._find_recurring_failures(failed_tests),
-            'failure_timeline': self._analyze_failure_timeline(failed_tests)
+            'common_failures': self._find_common_failures(failure_messages),
+            'failure_by_suite': self._group_failures_by_suite(failed_suites),
+            'failure_by_category': self._group_failures_by_category(failed_categories),
+            'failure_keywords': self._extract_failure_keywords(failure_messages),
+            'recurring_failures': self._find_recurring_failures(failed_names),
+            'failure_timeline': self._analyze_failure_timeline(failed_timestamps)
         }
-        
+
         return failure_analysis
     
+    @_memoize
     def analyze_test_quality(self) -> Dict[str, Any]:
         """Analyze overall test quality metrics"""
         if not self.test_results:
             return {'error': 'No test results available'}
         
-        total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r.get('status') == 'PASSED'])
-        failed_tests = len([r for r in self.test_results if r.get('status') == 'FAILED'])
-        skipped_tests = len([r for r in self.test_results if r.get('status') == 'SKIPPED'])
-        
+        self._compute_summary()
+
         quality_metrics = {
             'overall_quality_score': self._calculate_quality_score(),
             'reliability_score': self._calculate_reliability_score(),
@@ -92,6 +419,7 @@ class AnalyticsEngine:
         
         return quality_metrics
     
+    @_memoize(time_relative=True)
     def analyze_trends(self, time_period: str = '7d') -> Dict[str, Any]:
         """Analyze trends over time periods"""
         if not self.test_results:
@@ -115,8 +443,14 @@ class AnalyticsEngine:
         
         return trend_analysis
     
+    @_memoize
     def generate_insights(self) -> Dict[str, Any]:
         """Generate actionable insights from test data"""
+        # Fast path: with no results every sub-analysis is empty, and the
+        # optimization check would divide by zero
+        if not self.test_results:
+            return {'error': 'No test results available'}
+
         insights = {
             'key_findings': self._generate_key_findings(),
             'critical_issues': self._identify_critical_issues(),
@@ -130,85 +464,72 @@ class AnalyticsEngine:
     
     def _get_slowest_tests(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get slowest performing tests"""
-        sorted_tests = sorted(self.test_results, key=lambda x: x.get('duration', 0), reverse=True)
+        # Heap select is O(N log limit) versus a full O(N log N) sort
+        self._compute_summary()
+        slowest = heapq.nlargest(limit, self._records, key=lambda record: record.duration)
         return [
             {
-                'name': test.get('name', ''),
-                'duration': test.get('duration', 0),
-                'suite': test.get('suite', ''),
-                'status': test.get('status', '')
+                'name': test.name,
+                'duration': test.duration,
+                'suite': test.suite,
+                'status': test.status or ''
             }
-            for test in sorted_tests[:limit]
+            for test in slowest
         ]
-    
+
     def _get_fastest_tests(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get fastest performing tests"""
-        sorted_tests = sorted(self.test_results, key=lambda x: x.get('duration', 0))
+        self._compute_summary()
+        fastest = heapq.nsmallest(limit, self._records, key=lambda record: record.duration)
         return [
             {
-                'name': test.get('name', ''),
-                'duration': test.get('duration', 0),
-                'suite': test.get('suite', ''),
-                'status': test.get('status', '')
+                'name': test.name,
+                'duration': test.duration,
+                'suite': test.suite,
+                'status': test.status or ''
             }
-            for test in sorted_tests[:limit]
+            for test in fastest
         ]
     
     def _analyze_duration_distribution(self) -> Dict[str, Any]:
         """Analyze distribution of test durations"""
-        durations = [result.get('duration', 0) for result in self.test_results]
-        
-        if not durations:
+        if not self.test_results:
             return {}
-        
-        # Create duration buckets
-        buckets = {
-            '0-1s': 0,
-            '1-5s': 0,
-            '5-10s': 0,
-            '10-30s': 0,
-            '30-60s': 0,
-            '60s+': 0
-        }
-        
-        for duration in durations:
-            if duration <= 1:
-                buckets['0-1s'] += 1
-            elif duration <= 5:
-                buckets['1-5s'] += 1
-            elif duration <= 10:
-                buckets['5-10s'] += 1
-            elif duration <= 30:
-                buckets['10-30s'] += 1
-            elif duration <= 60:
-                buckets['30-60s'] += 1
-            else:
-                buckets['60s+'] += 1
-        
+
+        self._compute_summary()
+
         return {
-            'distribution': buckets,
-            'total_tests': len(durations)
+            'distribution': dict(self._duration_buckets),
+            'total_tests': len(self.test_results)
         }
     
+    def _results_sorted_by_timestamp(self) -> List[_TestRecord]:
+        """Records in timestamp order, sorted once per dataset"""
+        if self._sorted_by_ts is None:
+            self._compute_summary()
+            self._sorted_by_ts = sorted(self._records, key=lambda record: record.timestamp)
+        return self._sorted_by_ts
+
     def _analyze_performance_trends(self) -> Dict[str, Any]:
         """Analyze performance trends over time"""
-        # Sort tests by timestamp
-        sorted_tests = sorted(self.test_results, key=lambda x: x.get('timestamp', ''))
+        sorted_tests = self._results_sorted_by_timestamp()
         
         if len(sorted_tests) < 2:
             return {'trend': 'insufficient_data'}
         
-        # Calculate moving average of durations
+        # Calculate moving average of durations via a prefix sum - each
+        # window is a subtraction instead of an O(window) slice-and-sum
         window_size = min(10, len(sorted_tests) // 2)
-        moving_averages = []
-        
-        for i in range(window_size, len(sorted_tests)):
-            window = [test.get('duration', 0) for test in sorted_tests[i-window_size:i]]
-            avg_duration = sum(window) / len(window)
-            moving_averages.append({
-                'timestamp': sorted_tests[i].get('timestamp', ''),
-                'avg_duration': avg_duration
-            })
+        durations = [test.duration for test in sorted_tests]
+        prefix = list(accumulate(durations, initial=0.0))
+
+        moving_averages = [
+            {
+                'timestamp': sorted_tests[i].timestamp,
+                'avg_duration': (prefix[i] - prefix[i - window_size]) / window_size
+            }
+            for i in range(window_size, len(sorted_tests))
+        ]
         
         # Determine trend direction
         if len(moving_averages) >= 2:
@@ -243,19 +564,17 @@ class AnalyticsEngine:
         
         return ((last - first) / first) * 100
     
-    def _find_common_failures(self, failed_tests: List[Dict]) -> List[Dict[str, Any]]:
+    def _find_common_failures(self, failure_messages: List[str]) -> List[Dict[str, Any]]:
         """Find most common failure patterns"""
-        failure_messages = [test.get('error_details', '') or test.get('message', '') for test in failed_tests]
-        
-        # Extract key phrases from failure messages
-        key_phrases = []
+        # Count key phrases per message as they are extracted - no
+        # intermediate all-words list grows to the size of the corpus, and
+        # only the kept tokens are lowercased rather than copying every
+        # message wholesale
+        phrase_counts = Counter()
         for message in failure_messages:
-            # Simple keyword extraction
-            words = re.findall(r'\b\w{4,}\b', message.lower())
-            key_phrases.extend(words)
-        
-        # Count phrase frequency
-        phrase_counts = Counter(key_phrases)
+            if not message:
+                continue
+            phrase_counts.update(word.lower() for word in _WORD_RE.findall(message))
         
         return [
             {'phrase': phrase, 'count': count}
@@ -263,85 +582,59 @@ class AnalyticsEngine:
             if count > 1  # Only include phrases that appear multiple times
         ]
     
-    def _group_failures_by_suite(self, failed_tests: List[Dict]) -> Dict[str, int]:
+    def _group_failures_by_suite(self, failed_suites: List[str]) -> Dict[str, int]:
         """Group failures by test suite"""
-        suite_failures = Counter(test.get('suite', 'Unknown') for test in failed_tests)
-        return dict(suite_failures)
-    
-    def _group_failures_by_category(self, failed_tests: List[Dict]) -> Dict[str, int]:
+        return dict(Counter(failed_suites))
+
+    def _group_failures_by_category(self, failed_categories: List[str]) -> Dict[str, int]:
         """Group failures by test category"""
-        category_failures = Counter(test.get('category', 'Unknown') for test in failed_tests)
-        return dict(category_failures)
-    
-    def _extract_failure_keywords(self, failed_tests: List[Dict]) -> List[Dict[str, Any]]:
+        return dict(Counter(failed_categories))
+
+    def _extract_failure_keywords(self, failure_messages: List[str]) -> List[Dict[str, Any]]:
         """Extract keywords from failure messages"""
-        all_text = ' '.join([
-            test.get('error_details', '') or test.get('message', '') 
-            for test in failed_tests
-        ]).lower()
-        
-        # Common failure-related keywords
-        failure_keywords = [
-            'timeout', 'connection', 'error', 'exception', 'failed', 'not found',
-            'assertion', 'validation', 'permission', 'authentication', 'network'
-        ]
-        
-        keyword_counts = {}
-        for keyword in failure_keywords:
-            count = all_text.count(keyword)
-            if count > 0:
-                keyword_counts[keyword] = count
-        
+        keyword_counts = _count_failure_keywords(failure_messages)
+
         return [
             {'keyword': keyword, 'frequency': count}
-            for keyword, count in sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)
+            for keyword, count in keyword_counts.most_common()
         ]
     
-    def _find_recurring_failures(self, failed_tests: List[Dict]) -> List[Dict[str, Any]]:
+    def _find_recurring_failures(self, failed_names: List[str]) -> List[Dict[str, Any]]:
         """Find tests that fail repeatedly"""
-        test_failures = defaultdict(int)
-        
-        for test in failed_tests:
-            test_name = test.get('name', '')
-            if test_name:
-                test_failures[test_name] += 1
-        
-        # Return tests that failed more than once
-        recurring = [
+        test_failures = Counter(test_name for test_name in failed_names if test_name)
+
+        # Counter.most_common sorts in C, so only the >1 filter runs in Python
+        return [
             {'test_name': test_name, 'failure_count': count}
-            for test_name, count in test_failures.items()
+            for test_name, count in test_failures.most_common()
             if count > 1
         ]
-        
-        return sorted(recurring, key=lambda x: x['failure_count'], reverse=True)
     
-    def _analyze_failure_timeline(self, failed_tests: List[Dict]) -> List[Dict[str, Any]]:
+    def _analyze_failure_timeline(self, failed_timestamps: List[str]) -> List[Dict[str, Any]]:
         """Analyze failure patterns over time"""
         # Group failures by day
         daily_failures = defaultdict(int)
-        
-        for test in failed_tests:
-            timestamp = test.get('timestamp', '')
-            try:
-                if timestamp:
-                    date = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).date()
-                    daily_failures[date.isoformat()] += 1
-            except (ValueError, TypeError):
-                continue
+
+        for timestamp in failed_timestamps:
+            parsed = _parse_timestamp(timestamp)
+            if parsed is not None:
+                daily_failures[parsed.date().isoformat()] += 1
         
         return [
             {'date': date, 'failure_count': count}
             for date, count in sorted(daily_failures.items())
         ]
     
+    @_memoize
     def _calculate_quality_score(self) -> float:
         """Calculate overall quality score (0-100)"""
         if not self.test_results:
             return 0.0
         
+        self._compute_summary()
         total = len(self.test_results)
-        passed = len([r for r in self.test_results if r.get('status') == 'PASSED'])
-        
+        passed = self._status_counts['PASSED']
+
         # Base score on pass rate
         base_score = (passed / total) * 100
         
@@ -357,7 +650,8 @@ class AnalyticsEngine:
         
         # Count stable tests (same result across multiple runs if available)
         # For now, use pass rate as reliability indicator
-        passed = len([r for r in self.test_results if r.get('status') == 'PASSED'])
+        self._compute_summary()
+        passed = self._status_counts['PASSED']
         total = len(self.test_results)
         
         return (passed / total * 100) if total > 0 else 0.0
@@ -369,7 +663,8 @@ class AnalyticsEngine:
         
         # Consider tests that actually found defects
         # This is a simplified calculation
-        failed_tests = len([r for r in self.test_results if r.get('status') == 'FAILED'])
+        self._compute_summary()
+        failed_tests = self._status_counts['FAILED']
         total_tests = len(self.test_results)
         
         # Higher failure rate might indicate effective testing (finding issues)
@@ -394,28 +689,20 @@ class AnalyticsEngine:
         # Simple implementation - can be enhanced
         return 5.0  # Default bonus
     
+    @_memoize
     def _analyze_quality_by_category(self) -> Dict[str, Dict[str, Any]]:
         """Analyze quality metrics by test category"""
-        categories = {}
-        
-        for result in self.test_results:
-            category = result.get('category', 'Unknown')
-            if category not in categories:
-                categories[category] = {'total': 0, 'passed': 0, 'failed': 0}
-            
-            categories[category]['total'] += 1
-            if result.get('status') == 'PASSED':
-                categories[category]['passed'] += 1
-            else:
-                categories[category]['failed'] += 1
-        
-        # Calculate pass rates
-        for category in categories:
-            total = categories[category]['total']
-            passed = categories[category]['passed']
-            categories[category]['pass_rate'] = (passed / total * 100) if total > 0 else 0
-        
-        return categories
+        self._compute_summary()
+
+        return {
+            category: {
+                'total': total,
+                'passed': passed,
+                'failed': total - passed,
+                'pass_rate': (passed / total * 100) if total > 0 else 0
+            }
+            for category, (passed, total) in self._category_status.items()
+        }
     
     def _analyze_quality_trends(self) -> Dict[str, Any]:
         """Analyze quality trends over time"""
@@ -423,15 +710,13 @@ class AnalyticsEngine:
         daily_quality = defaultdict(lambda: {'total': 0, 'passed': 0})
         
         for result in self.test_results:
-            timestamp = result.get('timestamp', '')
-            try:
-                if timestamp:
-                    date = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).date()
-                    daily_quality[date.isoformat()]['total'] += 1
-                    if result.get('status') == 'PASSED':
-                        daily_quality[date.isoformat()]['passed'] += 1
-            except (ValueError, TypeError):
+            parsed = _parse_timestamp(result.get('timestamp', ''))
+            if parsed is None:
                 continue
+            day = daily_quality[parsed.date().isoformat()]
+            day['total'] += 1
+            if result.get('status') == 'PASSED':
+                day['passed'] += 1
         
         # Calculate daily pass rates
         quality_trends = []
@@ -453,24 +738,24 @@ class AnalyticsEngine:
         if not self.test_results:
             return ['No test results available for analysis']
         
+        self._compute_summary()
         total = len(self.test_results)
-        passed = len([r for r in self.test_results if r.get('status') == 'PASSED'])
+        passed = self._status_counts['PASSED']
         pass_rate = (passed / total * 100) if total > 0 else 0
-        
+
         if pass_rate < 80:
             recommendations.append("Test quality is below acceptable threshold. Review failed tests and fix underlying issues.")
-        
+
         if pass_rate > 95:
             recommendations.append("Test quality is excellent. Consider increasing test coverage or complexity.")
-        
-        # Check for performance issues
-        slow_tests = [r for r in self.test_results if r.get('duration', 0) > 30]
-        if slow_tests:
-            recommendations.append(f"Found {len(slow_tests)} slow tests (>30s). Consider optimization.")
-        
+
+        # Check for performance issues (>30s equals the top two buckets)
+        slow_count = self._duration_buckets['30-60s'] + self._duration_buckets['60s+']
+        if slow_count:
+            recommendations.append(f"Found {slow_count} slow tests (>30s). Consider optimization.")
+
         # Check for flaky tests (simplified)
-        failed_tests = [r for r in self.test_results if r.get('status') == 'FAILED']
-        if len(failed_tests) > total * 0.2:
+        if self._status_counts['FAILED'] > total * 0.2:
             recommendations.append("High failure rate detected. Review test environment and stability.")
         
         if not recommendations:
@@ -478,6 +763,7 @@ class AnalyticsEngine:
         
         return recommendations
     
+    @_memoize
     def _analyze_test_coverage(self) -> Dict[str, Any]:
         """Analyze test coverage metrics"""
         # Analyze coverage by different dimensions
@@ -492,37 +778,40 @@ class AnalyticsEngine:
     
     def _calculate_coverage_by_category(self) -> Dict[str, int]:
         """Calculate test count by category"""
-        return dict(Counter(result.get('category', 'Unknown') for result in self.test_results))
-    
+        self._compute_summary()
+        return {category: tally[1] for category, tally in self._category_status.items()}
+
     def _calculate_coverage_by_suite(self) -> Dict[str, int]:
         """Calculate test count by suite"""
-        return dict(Counter(result.get('suite', 'Unknown') for result in self.test_results))
-    
+        self._compute_summary()
+        return {suite: tally[1] for suite, tally in self._suite_status.items()}
+
     def _calculate_coverage_by_priority(self) -> Dict[str, int]:
         """Calculate test count by priority"""
-        return dict(Counter(result.get('priority', 'medium') for result in self.test_results))
-    
+        self._compute_summary()
+        return dict(self._priority_counts)
+
     def _identify_coverage_gaps(self) -> List[str]:
         """Identify potential coverage gaps"""
         gaps = []
-        
-        categories = set(result.get('category', 'Unknown') for result in self.test_results)
-        if len(categories) < 3:
+
+        self._compute_summary()
+        if len(self._category_status) < 3:
             gaps.append("Limited test categories detected. Consider broader coverage.")
-        
-        priorities = set(result.get('priority', 'medium') for result in self.test_results)
-        if 'high' not in priorities:
+
+        if 'high' not in self._priority_counts:
             gaps.append("No high-priority tests found. Add critical path tests.")
-        
+
         return gaps
     
-    def _filter_by_time_period(self, time_period: str) -> List[Dict[str, Any]]:
+    def _filter_by_time_period(self, time_period: str) -> List[_TestRecord]:
         """Filter test results by time period"""
         if not self.test_results:
             return []
-        
+
+        self._compute_summary()
         now = datetime.now()
-        
+
         if time_period == '1d':
             cutoff = now - timedelta(days=1)
         elif time_period == '7d':
@@ -530,28 +819,22 @@ class AnalyticsEngine:
         elif time_period == '30d':
             cutoff = now - timedelta(days=30)
         else:
-            return self.test_results
-        
-        filtered = []
-        for result in self.test_results:
-            timestamp = result.get('timestamp', '')
-            try:
-                if timestamp:
-                    result_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    if result_time >= cutoff:
-                        filtered.append(result)
-            except (ValueError, TypeError):
-                continue
-        
-        return filtered
+            return self._records
+
+        # Binary search over the timestamp-sorted index from the summary
+        # pass; everything at or after the cutoff is in the tail. The
+        # results come back in timestamp order, which none of the trend
+        # consumers are sensitive to.
+        lo = bisect.bisect_left(self._ts_sorted, (cutoff,))
+        return [self._records[index] for _, index in self._ts_sorted[lo:]]
     
-    def _analyze_pass_rate_trend(self, filtered_results: List[Dict]) -> Dict[str, Any]:
+    def _analyze_pass_rate_trend(self, filtered_results: List[_TestRecord]) -> Dict[str, Any]:
         """Analyze pass rate trends"""
         if not filtered_results:
             return {}
-        
+
         total = len(filtered_results)
-        passed = len([r for r in filtered_results if r.get('status') == 'PASSED'])
+        passed = sum(1 for r in filtered_results if r.status == 'PASSED')
         pass_rate = (passed / total * 100) if total > 0 else 0
         
         return {
@@ -559,21 +842,23 @@ class AnalyticsEngine:
             'trend': 'stable'  # Simplified - could be enhanced with historical data
         }
     
-    def _analyze_performance_trend(self, filtered_results: List[Dict]) -> Dict[str, Any]:
+    def _analyze_performance_trend(self, filtered_results: List[_TestRecord]) -> Dict[str, Any]:
         """Analyze performance trends"""
-        durations = [r.get('duration', 0) for r in filtered_results]
-        
+        durations = [r.duration for r in filtered_results]
+
         if not durations:
             return {}
-        
+
+        # statistics.mean is pure Python with exact-ratio bookkeeping;
+        # sum()/len() is the C loop and plenty for a display average
         return {
-            'avg_duration': statistics.mean(durations),
+            'avg_duration': sum(durations) / len(durations),
             'trend': 'stable'  # Simplified
         }
     
-    def _analyze_stability(self, filtered_results: List[Dict]) -> Dict[str, Any]:
+    def _analyze_stability(self, filtered_results: List[_TestRecord]) -> Dict[str, Any]:
         """Analyze test execution stability"""
-        failed_count = len([r for r in filtered_results if r.get('status') in ['FAILED', 'ERROR']])
+        failed_count = sum(1 for r in filtered_results if r.status in ('FAILED', 'ERROR'))
         total_count = len(filtered_results)
         
         stability_score = ((total_count - failed_count) / total_count * 100) if total_count > 0 else 0
@@ -583,41 +868,39 @@ class AnalyticsEngine:
             'stability_level': 'high' if stability_score > 90 else 'medium' if stability_score > 70 else 'low'
         }
     
-    def _identify_improvement_areas(self, filtered_results: List[Dict]) -> List[str]:
+    def _identify_improvement_areas(self, filtered_results: List[_TestRecord]) -> List[str]:
         """Identify areas for improvement"""
         areas = []
-        
-        failed_tests = [r for r in filtered_results if r.get('status') in ['FAILED', 'ERROR']]
-        if failed_tests:
-            areas.append(f"Address {len(failed_tests)} failing tests")
-        
-        slow_tests = [r for r in filtered_results if r.get('duration', 0) > 20]
-        if slow_tests:
-            areas.append(f"Optimize {len(slow_tests)} slow tests")
+
+        failed_count = sum(1 for r in filtered_results if r.status in ('FAILED', 'ERROR'))
+        if failed_count:
+            areas.append(f"Address {failed_count} failing tests")
+
+        slow_count = sum(1 for r in filtered_results if r.duration > 20)
+        if slow_count:
+            areas.append(f"Optimize {slow_count} slow tests")
         
         return areas
     
-    def _identify_peak_failure_times(self, filtered_results: List[Dict]) -> List[Dict[str, Any]]:
+    def _identify_peak_failure_times(self, filtered_results: List[_TestRecord]) -> List[Dict[str, Any]]:
         """Identify times with highest failure rates"""
-        # Group failures by hour
-        hourly_failures = defaultdict(int)
-        
+        # Count failures into a fixed 24-slot histogram - plain list
+        # indexing, no per-hour hashing
+        hour_counts = [0] * 24
+
         for result in filtered_results:
-            if result.get('status') in ['FAILED', 'ERROR']:
-                timestamp = result.get('timestamp', '')
-                try:
-                    if timestamp:
-                        hour = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).hour
-                        hourly_failures[hour] += 1
-                except (ValueError, TypeError):
-                    continue
-        
+            if result.status in ('FAILED', 'ERROR'):
+                parsed = _parse_timestamp(result.timestamp)
+                if parsed is not None:
+                    hour_counts[parsed.hour] += 1
+
         # Return top 3 hours with most failures
-        sorted_hours = sorted(hourly_failures.items(), key=lambda x: x[1], reverse=True)[:3]
-        
+        top_hours = heapq.nlargest(
+            3, ((count, hour) for hour, count in enumerate(hour_counts) if count > 0))
+
         return [
             {'hour': hour, 'failure_count': count}
-            for hour, count in sorted_hours
+            for count, hour in top_hours
         ]
     
     def _generate_key_findings(self) -> List[str]:
@@ -627,27 +910,23 @@ class AnalyticsEngine:
         if not self.test_results:
             return ['No test results available for analysis']
         
+        self._compute_summary()
         total = len(self.test_results)
-        passed = len([r for r in self.test_results if r.get('status') == 'PASSED'])
+        passed = self._status_counts['PASSED']
         pass_rate = (passed / total * 100) if total > 0 else 0
-        
+
         findings.append(f"Overall pass rate: {pass_rate:.1f}%")
-        
+
         if pass_rate < 80:
             findings.append("Test quality needs improvement")
         elif pass_rate > 95:
             findings.append("Test quality is excellent")
-        
+
         # Find most problematic suite
-        suite_performance = defaultdict(list)
-        for result in self.test_results:
-            suite = result.get('suite', 'Unknown')
-            suite_performance[suite].append(result.get('status') == 'PASSED')
-        
         worst_suite = None
         worst_rate = 100
-        for suite, statuses in suite_performance.items():
-            rate = sum(statuses) / len(statuses) * 100
+        for suite, (suite_passed, suite_total) in self._suite_status.items():
+            rate = suite_passed / suite_total * 100
             if rate < worst_rate:
                 worst_rate = rate
                 worst_suite = suite
@@ -662,23 +941,23 @@ class AnalyticsEngine:
         issues = []
         
         # Check for high failure rate
+        self._compute_summary()
         total = len(self.test_results)
-        failed = len([r for r in self.test_results if r.get('status') in ['FAILED', 'ERROR']])
-        
+        failed = self._status_counts['FAILED'] + self._status_counts['ERROR']
+
         if total > 0 and failed / total > 0.3:
             issues.append(f"High failure rate: {failed}/{total} tests failed")
-        
+
         # Check for very slow tests
-        slow_tests = [r for r in self.test_results if r.get('duration', 0) > 60]
-        if slow_tests:
-            issues.append(f"Found {len(slow_tests)} tests taking longer than 60 seconds")
+        slow_count = self._duration_buckets['60s+']
+        if slow_count:
+            issues.append(f"Found {slow_count} tests taking longer than 60 seconds")
         
         # Check for flaky tests (simplified)
-        test_names = [r.get('name', '') for r in self.test_results]
-        name_counts = Counter(test_names)
-        flaky_tests = [name for name, count in name_counts.items() if count > 1]
-        if flaky_tests:
-            issues.append(f"Detected {len(flaky_tests)} potentially flaky tests")
+        name_counts = Counter(record.name for record in self._records)
+        flaky_count = sum(1 for count in name_counts.values() if count > 1)
+        if flaky_count:
+            issues.append(f"Detected {flaky_count} potentially flaky tests")
         
         return issues
     
@@ -687,13 +966,13 @@ class AnalyticsEngine:
         opportunities = []
         
         # Performance optimization
-        avg_duration = statistics.mean([r.get('duration', 0) for r in self.test_results])
+        self._compute_summary()
+        avg_duration = self._duration_sum / len(self.test_results)
         if avg_duration > 10:
             opportunities.append(f"Average test duration is {avg_duration:.1f}s - consider optimization")
-        
+
         # Test organization
-        categories = set(r.get('category', 'Unknown') for r in self.test_results)
-        if len(categories) > 10:
+        if len(self._category_status) > 10:
             opportunities.append("Large number of test categories - consider reorganization")
         
         # Parallel execution potential
@@ -710,11 +989,12 @@ class AnalyticsEngine:
             risks['overall'] = 'unknown'
             return risks
         
+        self._compute_summary()
         total = len(self.test_results)
-        failed = len([r for r in self.test_results if r.get('status') in ['FAILED', 'ERROR']])
+        failed = self._status_counts['FAILED'] + self._status_counts['ERROR']
         failure_rate = failed / total if total > 0 else 0
-        
-        avg_duration = statistics.mean([r.get('duration', 0) for r in self.test_results])
+
+        avg_duration = self._duration_sum / total
         
         # Overall risk assessment
         if failure_rate > 0.3:
@@ -745,21 +1025,22 @@ class AnalyticsEngine:
         if not self.test_results:
             return [{'priority': 'high', 'action': 'Run tests to get baseline metrics', 'category': 'setup'}]
         
-        failed_tests = [r for r in self.test_results if r.get('status') in ['FAILED', 'ERROR']]
-        slow_tests = [r for r in self.test_results if r.get('duration', 0) > 20]
-        
-        if failed_tests:
+        self._compute_summary()
+        failed_count = self._status_counts['FAILED'] + self._status_counts['ERROR']
+        slow_count = self._slow_count
+
+        if failed_count:
             action_items.append({
                 'priority': 'high',
-                'action': f'Fix {len(failed_tests)} failing tests',
+                'action': f'Fix {failed_count} failing tests',
                 'category': 'quality',
                 'details': 'Address failed tests to improve pass rate'
             })
-        
-        if slow_tests:
+
+        if slow_count:
             action_items.append({
                 'priority': 'medium',
-                'action': f'Optimize {len(slow_tests)} slow tests',
+                'action': f'Optimize {slow_count} slow tests',
                 'category': 'performance',
                 'details': 'Reduce execution time for slow tests'
             })
@@ -779,10 +1060,11 @@ class AnalyticsEngine:
         if not self.test_results:
             return "No test results available for analysis."
         
+        self._compute_summary()
         total = len(self.test_results)
-        passed = len([r for r in self.test_results if r.get('status') == 'PASSED'])
+        passed = self._status_counts['PASSED']
         pass_rate = (passed / total * 100) if total > 0 else 0
-        avg_duration = statistics.mean([r.get('duration', 0) for r in self.test_results])
+        avg_duration = self._duration_sum / total
         
         summary = f"""
         Test Execution Summary:
@@ -790,8 +1072,8 @@ class AnalyticsEngine:
         - Pass Rate: {pass_rate:.1f}%
         - Average Duration: {avg_duration:.1f}s
         
-        Quality Assessment: {'Good' if pass_rate > 90 else 'Needs Improvement' if pass_rate > 70 else 'Poor'}
-        Performance: {'Good' if avg_duration < 5 else 'Needs Optimization' if avg_duration < 15 else 'Poor'}
+        Quality Assessment: {_QUALITY_LABELS[bisect.bisect_left(_QUALITY_THRESHOLDS, pass_rate)]}
+        Performance: {_PERFORMANCE_LABELS[bisect.bisect_right(_PERFORMANCE_THRESHOLDS, avg_duration)]}
         """
         
         return summary.strip()
@@ -12,23 +12,42 @@ This example demonstrates all features of the reporting module:
 Run this example to see the complete reporting system in action.
 """
 
+import io
 import sys
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from reporting import (
-    HTMLReportGenerator,
-    AITestGenerator,
-    TestAggregator,
-    AnalyticsEngine,
-    NotificationSystem,
-    MetricsCalculator
-)
-from reporting.notification_system import NotificationChannel, NotificationRule, NotificationPriority
+# The reporting classes are imported inside each demonstrate_* function:
+# importing this module stays cheap, and a caller who only wants one demo
+# does not pay for the other five subsystems. sys.modules makes repeat
+# imports free.
+
+
+# Output locations, resolved once. Path caches its own str() so repeated
+# joins and writes below avoid redundant string work and stat calls.
+REPORTS_DIR = Path("reports")
+GENERATED_TESTS_DIR = Path("generated_tests")
+_dirs_initialized = False
+
+
+def _ensure_output_dirs():
+    """Create the output directories on first use only."""
+    global _dirs_initialized
+    if not _dirs_initialized:
+        REPORTS_DIR.mkdir(exist_ok=True)
+        GENERATED_TESTS_DIR.mkdir(exist_ok=True)
+        _dirs_initialized = True
+
+
+# Realistic status distribution for sample results. Passing cum_weights
+# lets random.choices skip its internal accumulate step on every draw.
+_STATUS_CHOICES = ('PASSED', 'FAILED', 'SKIPPED', 'ERROR')
+_STATUS_CUM_WEIGHTS = (0.85, 0.95, 0.99, 1.0)
 
 
 def generate_sample_test_results():
@@ -46,13 +65,28 @@ def generate_sample_test_results():
         'test_user_permissions', 'test_session_management', 'test_data_encryption'
     ]
     
+    count = 50  # Generate 50 sample test results
+
+    # Draw every random field for the whole batch up front - one
+    # random.choices call per field does its weight bookkeeping once
+    # instead of once per row, leaving the loop to assemble dicts
+    statuses = random.choices(_STATUS_CHOICES, cum_weights=_STATUS_CUM_WEIGHTS, k=count)
+    names = random.choices(test_names, k=count)
+    suites = random.choices(test_suites, k=count)
+    categories = random.choices(test_categories, k=count)
+    hour_offsets = random.choices(range(73), k=count)
+    tags = random.choices(['smoke', 'regression', 'critical', 'optional'], k=count)
+    priorities = random.choices(['high', 'medium', 'low'], k=count)
+    browsers = random.choices(['chrome', 'firefox', 'safari'], k=count)
+    operating_systems = random.choices(['windows', 'macos', 'linux'], k=count)
+    test_types = random.choices(['functional', 'ui', 'api'], k=count)
+
+    now = datetime.now()
     results = []
-    
-    for i in range(50):  # Generate 50 sample test results
-        # Simulate test execution with realistic distribution
-        status_weights = [0.85, 0.10, 0.04, 0.01]  # PASSED, FAILED, SKIPPED, ERROR
-        status = random.choices(['PASSED', 'FAILED', 'SKIPPED', 'ERROR'], weights=status_weights)[0]
-        
+
+    for i in range(count):
+        status = statuses[i]
+
         # Generate realistic duration (some tests are slower)
         if status == 'FAILED':
             duration = random.uniform(1, 25)  # Failed tests might run longer
@@ -60,64 +94,66 @@ def generate_sample_test_results():
             duration = random.uniform(0.5, 15)  # Passed tests vary in speed
         else:
             duration = random.uniform(0.1, 5)  # Skipped/error tests are usually fast
-        
+
         result = {
             'id': f'TEST_{i+1:03d}',
-            'name': random.choice(test_names),
-            'suite': random.choice(test_suites),
-            'category': random.choice(test_categories),
+            'name': names[i],
+            'suite': suites[i],
+            'category': categories[i],
             'status': status,
             'duration': round(duration, 2),
-            'timestamp': (datetime.now() - timedelta(hours=random.randint(0, 72))).isoformat(),
+            'timestamp': (now - timedelta(hours=hour_offsets[i])).isoformat(),
             'message': 'Test completed successfully' if status == 'PASSED' else 'Test failed with assertion error',
             'error_details': 'Connection timeout' if status == 'FAILED' and random.random() > 0.5 else '',
-            'tags': [random.choice(['smoke', 'regression', 'critical', 'optional'])],
-            'priority': random.choice(['high', 'medium', 'low']),
-            'browser': random.choice(['chrome', 'firefox', 'safari']),
-            'os': random.choice(['windows', 'macos', 'linux']),
-            'test_type': random.choice(['functional', 'ui', 'api'])
+            'tags': [tags[i]],
+            'priority': priorities[i],
+            'browser': browsers[i],
+            'os': operating_systems[i],
+            'test_type': test_types[i]
         }
         results.append(result)
-    
+
     return results
 
 
-def demonstrate_html_reporting():
+def demonstrate_html_reporting(test_results=None):
     """Demonstrate HTML report generation"""
-    print("=" * 60)
-    print("HTML REPORT GENERATION DEMO")
-    print("=" * 60)
-    
-    # Generate sample results
-    test_results = generate_sample_test_results()
-    
+    # Each demo collects its output and writes it in one call - a single
+    # buffered write instead of a stdout lock/flush per print
+    lines = ["=" * 60, "HTML REPORT GENERATION DEMO", "=" * 60]
+
+    from reporting import HTMLReportGenerator
+
+    if test_results is None:
+        test_results = generate_sample_test_results()
+
     # Create report generator
-    report_gen = HTMLReportGenerator(output_dir="reports")
-    
+    _ensure_output_dirs()
+    report_gen = HTMLReportGenerator(output_dir=REPORTS_DIR)
+
     # Generate HTML report
     html_file = report_gen.generate_report(
         test_results=test_results,
         title="Q4 2024 Test Execution Report",
         description="Comprehensive test execution results for quarterly release"
     )
-    
-    print(f"✅ HTML Report generated: {html_file}")
-    
+
+    lines.append(f"✅ HTML Report generated: {html_file}")
+
     # Export to other formats
     json_file = report_gen.export_to_json(test_results)
     csv_file = report_gen.export_to_csv(test_results)
-    
-    print(f"✅ JSON export: {json_file}")
-    print(f"✅ CSV export: {csv_file}")
-    print()
+
+    lines.append(f"✅ JSON export: {json_file}")
+    lines.append(f"✅ CSV export: {csv_file}")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demonstrate_ai_test_generation():
     """Demonstrate AI test generation from user stories"""
-    print("=" * 60)
-    print("AI TEST GENERATION DEMO")
-    print("=" * 60)
-    
+    lines = ["=" * 60, "AI TEST GENERATION DEMO", "=" * 60]
+
     # Sample user stories
     user_stories = [
         "As a customer, I want to login to my account so that I can access my personalized dashboard",
@@ -126,227 +162,256 @@ def demonstrate_ai_test_generation():
         "As an admin, I want to manage user accounts so that I can control access to the system",
         "As a customer, I want to track my order status so that I know when my items will arrive"
     ]
-    
+
+    from reporting import AITestGenerator
+
     # Create AI test generator
     ai_generator = AITestGenerator()
-    
+
     # Generate tests from user stories
     test_suite = ai_generator.generate_tests(user_stories, story_type='web_application')
-    
-    print(f"📝 Processed {len(user_stories)} user stories")
-    print(f"🧪 Generated {test_suite['total_tests_generated']} test cases")
-    print(f"⚡ Average confidence score: {test_suite['test_suite']['metadata']['confidence_score']:.2f}")
-    print(f"⏱️ Estimated total duration: {test_suite['test_suite']['metadata']['estimated_total_duration']} minutes")
-    
+
+    lines.append(f"📝 Processed {len(user_stories)} user stories")
+    lines.append(f"🧪 Generated {test_suite['total_tests_generated']} test cases")
+    lines.append(f"⚡ Average confidence score: {test_suite['test_suite']['metadata']['confidence_score']:.2f}")
+    lines.append(f"⏱️ Estimated total duration: {test_suite['test_suite']['metadata']['estimated_total_duration']} minutes")
+
     # Show test distribution
     tests_by_type = test_suite['tests_by_type']
-    print("\nTest distribution by type:")
+    lines.append("\nTest distribution by type:")
     for test_type, tests in tests_by_type.items():
-        print(f"  • {test_type.title()}: {len(tests)} tests")
-    
+        lines.append(f"  • {test_type.title()}: {len(tests)} tests")
+
     # Save generated tests
-    json_file = ai_generator.save_generated_tests("generated_tests/generated_test_suite.json")
-    print(f"\n✅ Generated test suite saved: {json_file}")
-    
+    _ensure_output_dirs()
+    json_file = ai_generator.save_generated_tests(str(GENERATED_TESTS_DIR / "generated_test_suite.json"))
+    lines.append(f"\n✅ Generated test suite saved: {json_file}")
+
     # Export test scripts
-    script_files = ai_generator.export_test_scripts("generated_tests")
-    print(f"✅ Exported {len(script_files)} test scripts:")
+    script_files = ai_generator.export_test_scripts(str(GENERATED_TESTS_DIR))
+    lines.append(f"✅ Exported {len(script_files)} test scripts:")
     for script_file in script_files:
-        print(f"  • {script_file}")
-    
-    print()
+        lines.append(f"  • {script_file}")
 
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def demonstrate_test_aggregation():
+
+def demonstrate_test_aggregation(test_results=None):
     """Demonstrate test result aggregation"""
-    print("=" * 60)
-    print("TEST AGGREGATION DEMO")
-    print("=" * 60)
-    
+    lines = ["=" * 60, "TEST AGGREGATION DEMO", "=" * 60]
+
+    from reporting import TestAggregator
+
     # Create test aggregator
     aggregator = TestAggregator()
-    
+
     # Add results from multiple sources
-    test_results = generate_sample_test_results()
+    if test_results is None:
+        test_results = generate_sample_test_results()
     aggregator.add_results(test_results)
-    
+
     # Add some additional results to simulate multiple runs
     additional_results = generate_sample_test_results()
     aggregator.add_results(additional_results)
-    
+
     # Get summary
     summary = aggregator.get_summary()
-    print(f"📊 Aggregated {summary['total']} test results")
-    print(f"✅ Passed: {summary['passed']} ({summary['pass_rate']:.1f}%)")
-    print(f"❌ Failed: {summary['failed']}")
-    print(f"⏭️ Skipped: {summary['skipped']}")
-    print(f"⏱️ Total duration: {summary['total_duration']:.2f}s")
-    
+    lines.append(f"📊 Aggregated {summary['total']} test results")
+    lines.append(f"✅ Passed: {summary['passed']} ({summary['pass_rate']:.1f}%)")
+    lines.append(f"❌ Failed: {summary['failed']}")
+    lines.append(f"⏭️ Skipped: {summary['skipped']}")
+    lines.append(f"⏱️ Total duration: {summary['total_duration']:.2f}s")
+
     # Show breakdown by suite
-    print("\nResults by test suite:")
+    lines.append("\nResults by test suite:")
     for suite, count in summary['suite_breakdown'].items():
-        print(f"  • {suite}: {count} tests")
-    
+        lines.append(f"  • {suite}: {count} tests")
+
     # Get failed tests
     failed_tests = aggregator.get_failed_tests()
-    print(f"\n🚨 Found {len(failed_tests)} failed tests:")
+    lines.append(f"\n🚨 Found {len(failed_tests)} failed tests:")
     for test in failed_tests[:5]:  # Show first 5
-        print(f"  • {test.name} ({test.suite}) - {test.status}")
-    
+        lines.append(f"  • {test.name} ({test.suite}) - {test.status}")
+
     # Get slowest tests
     slowest_tests = aggregator.get_slowest_tests(5)
-    print(f"\n🐌 Top 5 slowest tests:")
+    lines.append(f"\n🐌 Top 5 slowest tests:")
     for test in slowest_tests:
-        print(f"  • {test.name}: {test.duration:.2f}s")
-    
+        lines.append(f"  • {test.name}: {test.duration:.2f}s")
+
     # Get trends
     trends = aggregator.get_trends_over_time('daily')
-    print(f"\n📈 Analyzed trends over {len(trends['trends'])} time periods")
-    
+    lines.append(f"\n📈 Analyzed trends over {len(trends['trends'])} time periods")
+
     # Export consolidated results
     export_file = aggregator.export_consolidated_results()
-    print(f"✅ Consolidated results exported: {export_file}")
-    
-    print()
+    lines.append(f"✅ Consolidated results exported: {export_file}")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def demonstrate_analytics():
+def demonstrate_analytics(test_results=None):
     """Demonstrate analytics engine"""
-    print("=" * 60)
-    print("ANALYTICS ENGINE DEMO")
-    print("=" * 60)
-    
-    # Generate sample results
-    test_results = generate_sample_test_results()
-    
+    lines = ["=" * 60, "ANALYTICS ENGINE DEMO", "=" * 60]
+
+    from reporting import AnalyticsEngine
+
+    if test_results is None:
+        test_results = generate_sample_test_results()
+
     # Create analytics engine
     analytics = AnalyticsEngine(test_results)
-    
+
     # Performance analysis
-    print("🏃 PERFORMANCE ANALYSIS")
+    lines.append("🏃 PERFORMANCE ANALYSIS")
     performance = analytics.analyze_performance()
     duration_stats = performance['duration_stats']
-    print(f"  • Average duration: {duration_stats['avg']:.2f}s")
-    print(f"  • Min/Max duration: {duration_stats['min']:.2f}s / {duration_stats['max']:.2f}s")
-    print(f"  • Total execution time: {duration_stats['total']:.2f}s")
-    
+    lines.append(f"  • Average duration: {duration_stats['avg']:.2f}s")
+    lines.append(f"  • Min/Max duration: {duration_stats['min']:.2f}s / {duration_stats['max']:.2f}s")
+    lines.append(f"  • Total execution time: {duration_stats['total']:.2f}s")
+
     # Failure pattern analysis
-    print("\n❌ FAILURE PATTERN ANALYSIS")
+    lines.append("\n❌ FAILURE PATTERN ANALYSIS")
     failures = analytics.analyze_failure_patterns()
-    print(f"  • Total failures: {failures['total_failures']}")
-    print(f"  • Failure rate: {failures['failure_rate']:.1f}%")
-    
+    lines.append(f"  • Total failures: {failures['total_failures']}")
+    lines.append(f"  • Failure rate: {failures['failure_rate']:.1f}%")
+
     if failures['common_failures']:
-        print("  • Most common failures:")
+        lines.append("  • Most common failures:")
         for failure in failures['common_failures'][:3]:
-            print(f"    - '{failure['phrase']}': {failure['count']} occurrences")
-    
+            lines.append(f"    - '{failure['phrase']}': {failure['count']} occurrences")
+
     # Quality analysis
-    print("\n📊 QUALITY ANALYSIS")
+    lines.append("\n📊 QUALITY ANALYSIS")
     quality = analytics.analyze_test_quality()
-    print(f"  • Overall quality score: {quality['overall_quality_score']:.1f}/100")
-    print(f"  • Reliability score: {quality['reliability_score']:.1f}/100")
-    print(f"  • Test effectiveness: {quality['test_effectiveness']:.1f}/100")
-    
+    lines.append(f"  • Overall quality score: {quality['overall_quality_score']:.1f}/100")
+    lines.append(f"  • Reliability score: {quality['reliability_score']:.1f}/100")
+    lines.append(f"  • Test effectiveness: {quality['test_effectiveness']:.1f}/100")
+
     # Generate insights
-    print("\n💡 KEY INSIGHTS")
+    lines.append("\n💡 KEY INSIGHTS")
     insights = analytics.generate_insights()
-    print("  • Key findings:")
+    lines.append("  • Key findings:")
     for finding in insights['key_findings'][:3]:
-        print(f"    - {finding}")
-    
+        lines.append(f"    - {finding}")
+
     if insights['critical_issues']:
-        print("  • Critical issues:")
+        lines.append("  • Critical issues:")
         for issue in insights['critical_issues'][:3]:
-            print(f"    - {issue}")
-    
+            lines.append(f"    - {issue}")
+
     # Recommendations
-    print("  • Recommendations:")
+    lines.append("  • Recommendations:")
     for rec in quality['recommendations'][:3]:
-        print(f"    - {rec}")
-    
-    print()
+        lines.append(f"    - {rec}")
 
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def demonstrate_notification_system():
+
+def demonstrate_notification_system(test_results=None):
     """Demonstrate notification system"""
-    print("=" * 60)
-    print("NOTIFICATION SYSTEM DEMO")
-    print("=" * 60)
-    
-    # Generate test results
-    test_results = generate_sample_test_results()
-    
+    # The notification system prints its console banners itself, so each
+    # chunk here is flushed before the library call it precedes - holding
+    # everything for one final write would push those banners above the
+    # section header they belong under
+    sys.stdout.write("\n".join(["=" * 60, "NOTIFICATION SYSTEM DEMO", "=" * 60]) + "\n")
+
+    from reporting import NotificationSystem
+    from reporting.notification_system import NotificationChannel
+
+    if test_results is None:
+        test_results = generate_sample_test_results()
+
     # Create notification system
     notification_system = NotificationSystem()
-    
+
     # Send test results notification
     results = notification_system.send_test_results_notification(test_results)
-    
-    print(f"📢 Sent {len(results)} notifications:")
+
+    lines = [f"📢 Sent {len(results)} notifications:"]
     for result in results:
         status = "✅" if result.success else "❌"
-        print(f"  {status} {result.channel}: {result.message}")
+        lines.append(f"  {status} {result.channel}: {result.message}")
         if result.error_details:
-            print(f"    Error: {result.error_details}")
-    
+            lines.append(f"    Error: {result.error_details}")
+
     # Demonstrate custom notification
-    print("\n🎯 CUSTOM NOTIFICATION")
+    lines.append("\n🎯 CUSTOM NOTIFICATION")
+    sys.stdout.write("\n".join(lines) + "\n")
+
     custom_result = notification_system.send_custom_notification(
         channel=NotificationChannel.CONSOLE,
         message="🚀 Custom notification: All systems are running smoothly!"
     )
-    
+
     status = "✅" if custom_result.success else "❌"
-    print(f"  {status} Custom notification: {custom_result.message}")
-    
-    print()
+    sys.stdout.write(f"  {status} Custom notification: {custom_result.message}\n\n")
 
 
-def demonstrate_metrics_calculation():
+def demonstrate_metrics_calculation(test_results=None):
     """Demonstrate metrics calculation"""
-    print("=" * 60)
-    print("METRICS CALCULATION DEMO")
-    print("=" * 60)
-    
-    # Generate test results
-    test_results = generate_sample_test_results()
-    
+    lines = ["=" * 60, "METRICS CALCULATION DEMO", "=" * 60]
+
+    from reporting import MetricsCalculator
+
+    if test_results is None:
+        test_results = generate_sample_test_results()
+
     # Create metrics calculator
     metrics_calc = MetricsCalculator(test_results)
-    
+
     # Calculate all metrics
     all_metrics = metrics_calc.calculate_all_metrics()
-    
+
     # Display KPI summary
-    print("📊 KEY PERFORMANCE INDICATORS")
+    lines.append("📊 KEY PERFORMANCE INDICATORS")
     kpis = all_metrics['kpi_summary']['kpis']
     for kpi, value in kpis.items():
-        print(f"  • {kpi.replace('_', ' ').title()}: {value:.1f}")
-    
+        lines.append(f"  • {kpi.replace('_', ' ').title()}: {value:.1f}")
+
     # Display status assessment
-    print("\n🎯 STATUS ASSESSMENT")
+    lines.append("\n🎯 STATUS ASSESSMENT")
     status = all_metrics['kpi_summary']['status_assessment']
     for kpi, kpi_status in status.items():
-        print(f"  • {kpi.replace('_', ' ').title()}: {kpi_status.upper()}")
-    
+        lines.append(f"  • {kpi.replace('_', ' ').title()}: {kpi_status.upper()}")
+
     # Display recommendations
-    print("\n💡 RECOMMENDATIONS")
+    lines.append("\n💡 RECOMMENDATIONS")
     recommendations = all_metrics['kpi_summary']['recommendations']
     for rec in recommendations[:3]:
-        print(f"  • {rec}")
-    
+        lines.append(f"  • {rec}")
+
     # Display priority actions
-    print("\n🚀 PRIORITY ACTIONS")
+    lines.append("\n🚀 PRIORITY ACTIONS")
     actions = all_metrics['kpi_summary']['priority_actions']
     for action in actions[:3]:
-        print(f"  • [{action['priority'].upper()}] {action['action']}")
-    
+        lines.append(f"  • [{action['priority'].upper()}] {action['action']}")
+
     # Display overall health score
     health_score = all_metrics['kpi_summary']['overall_health_score']
-    print(f"\n🏥 OVERALL HEALTH SCORE: {health_score:.1f}/100")
-    
-    print()
+    lines.append(f"\n🏥 OVERALL HEALTH SCORE: {health_score:.1f}/100")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+class _ThreadOutput:
+    """Routes writes to a per-thread buffer so concurrent demo output doesn't interleave"""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    def write(self, text):
+        target = getattr(self.local, 'buffer', None) or self.fallback
+        target.write(text)
+
+    def flush(self):
+        target = getattr(self.local, 'buffer', None) or self.fallback
+        target.flush()
 
 
 def create_comprehensive_demo():
@@ -364,18 +429,49 @@ def create_comprehensive_demo():
     print("="*80 + "\n")
     
     # Create output directories
-    os.makedirs("reports", exist_ok=True)
-    os.makedirs("generated_tests", exist_ok=True)
+    _ensure_output_dirs()
     
+    # One shared sample feeds every demo - five of the six ran their own
+    # 50-row generation before, which also made their outputs disagree
+    sample_results = generate_sample_test_results()
+
     # Run all demonstrations
     try:
-        demonstrate_html_reporting()
-        demonstrate_ai_test_generation()
-        demonstrate_test_aggregation()
-        demonstrate_analytics()
-        demonstrate_notification_system()
-        demonstrate_metrics_calculation()
-        
+        demos = (
+            (demonstrate_html_reporting, (sample_results,)),
+            (demonstrate_ai_test_generation, ()),
+            (demonstrate_test_aggregation, (sample_results,)),
+            (demonstrate_analytics, (sample_results,)),
+            (demonstrate_notification_system, (sample_results,)),
+            (demonstrate_metrics_calculation, (sample_results,)),
+        )
+
+        # The demos are independent and spend most of their time writing
+        # report files, so run them concurrently - wall-clock drops toward
+        # the slowest single demo. Each thread writes into its own buffer
+        # and the buffers are flushed in declared order, so the console
+        # output reads exactly as it did sequentially.
+        output = _ThreadOutput(sys.stdout)
+        sys.stdout = output
+
+        def _run_demo(demo, args):
+            output.local.buffer = io.StringIO()
+            try:
+                demo(*args)
+            finally:
+                buffer = output.local.buffer
+                output.local.buffer = None
+            return buffer.getvalue()
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(demos)) as executor:
+                futures = [executor.submit(_run_demo, demo, args) for demo, args in demos]
+                sections = [future.result() for future in futures]
+        finally:
+            sys.stdout = output.fallback
+
+        sys.stdout.write(''.join(sections))
+
         print("=" * 80)
         print("🎉 DEMO COMPLETED SUCCESSFULLY!")
         print("=" * 80)
@@ -7,8 +7,14 @@ This file contains configuration settings for:
 - Webhook notifications
 - Report generation settings
 - AI test generation settings
+
+All settings are frozen into read-only mappings at the bottom of this
+file, so they behave as constants: nothing can mutate them at runtime and
+callers never need defensive copies.
 """
 
+from types import MappingProxyType
+
 # Email Configuration
 EMAIL_CONFIG = {
     'smtp_server': 'smtp.gmail.com',
@@ -168,3 +174,19 @@ EXAMPLE_CONFIGS = {
         'features': ['reporting', 'analytics', 'notifications', 'ai_generation']
     }
 }
+
+# Freeze everything: a MappingProxyType is a read-only view, so accidental
+# writes raise immediately and the objects are safe to share and to key
+# caches on without copying
+EMAIL_CONFIG = MappingProxyType(EMAIL_CONFIG)
+SLACK_CONFIG = MappingProxyType(SLACK_CONFIG)
+TEAMS_CONFIG = MappingProxyType(TEAMS_CONFIG)
+WEBHOOK_CONFIG = MappingProxyType(WEBHOOK_CONFIG)
+REPORT_CONFIG = MappingProxyType(REPORT_CONFIG)
+AI_CONFIG = MappingProxyType(AI_CONFIG)
+NOTIFICATION_RULES = tuple(MappingProxyType(rule) for rule in NOTIFICATION_RULES)
+ANALYTICS_CONFIG = MappingProxyType(ANALYTICS_CONFIG)
+AGGREGATION_CONFIG = MappingProxyType(AGGREGATION_CONFIG)
+METRICS_CONFIG = MappingProxyType(METRICS_CONFIG)
+LOGGING_CONFIG = MappingProxyType(LOGGING_CONFIG)
+EXAMPLE_CONFIGS = MappingProxyType(EXAMPLE_CONFIGS)
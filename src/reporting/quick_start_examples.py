@@ -95,9 +95,9 @@ def example_2_ai_test_generation():
     if test_suite['test_suite']['tests']:
         sample_test = test_suite['test_suite']['tests'][0]
         print(f"\n📋 Sample generated test:")
-        print(f"   Name: {sample_test['name']}")
-        print(f"   Type: {sample_test['type']}")
-        print(f"   Steps: {len(sample_test['test_steps'])} steps")
+        print(f"   Name: {sample_test.name}")
+        print(f"   Type: {sample_test.type}")
+        print(f"   Steps: {len(sample_test.test_steps)} steps")
     
     # Save generated tests
     save_file = ai_generator.save_generated_tests()
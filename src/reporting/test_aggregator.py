@@ -9,8 +9,9 @@ Aggregates test results from multiple sources:
 - Generates aggregated statistics and metrics
 """
 
-import json
 import csv
+import heapq
+import json
 import xml.etree.ElementTree as ET
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timedelta
@@ -73,6 +74,9 @@ class TestAggregator:
         self.results = []
         self.source_files = []
         self.aggregation_metadata = {}
+        # Computed summary, reused until new results arrive - bursts of
+        # adds followed by repeated queries only pay for one aggregation
+        self._summary_cache = None
     
     def add_results(self, results: Union[List[Dict], List[TestResult], str]) -> None:
         """
@@ -81,6 +85,8 @@ class TestAggregator:
         Args:
             results: List of test results (dicts, TestResult objects) or file path
         """
+        self._summary_cache = None
+
         if isinstance(results, str):
             # It's a file path
             self._load_from_file(results)
@@ -200,6 +206,9 @@ class TestAggregator:
     
     def get_summary(self) -> Dict[str, Any]:
         """Get aggregated summary of all test results"""
+        if self._summary_cache is not None:
+            return self._summary_cache
+
         if not self.results:
             return {
                 'total': 0,
@@ -212,30 +221,32 @@ class TestAggregator:
                 'avg_duration': 0.0
             }
         
-        # Count statuses
-        status_counts = Counter(result.status for result in self.results)
-        
+        # One walk over the results fills every histogram and the duration
+        # sum together, instead of a separate pass per breakdown
+        status_counts = Counter()
+        suite_counts = Counter()
+        category_counts = Counter()
+        total_duration = 0.0
+        for result in self.results:
+            status_counts[result.status] += 1
+            suite_counts[result.suite] += 1
+            category_counts[result.category] += 1
+            total_duration += result.duration
+
         total = len(self.results)
         passed = status_counts.get('PASSED', 0)
         failed = status_counts.get('FAILED', 0)
         skipped = status_counts.get('SKIPPED', 0)
         errors = status_counts.get('ERROR', 0)
-        
+
         # Calculate metrics
-        total_duration = sum(result.duration for result in self.results)
         avg_duration = total_duration / total if total > 0 else 0
         pass_rate = (passed / total * 100) if total > 0 else 0
         
-        # Suites breakdown
-        suite_counts = Counter(result.suite for result in self.results)
-        
-        # Categories breakdown
-        category_counts = Counter(result.category for result in self.results)
-        
         # Recent trends (last 24 hours)
         recent_results = self._get_recent_results()
-        
-        return {
+
+        self._summary_cache = {
             'total': total,
             'passed': passed,
             'failed': failed,
@@ -251,7 +262,8 @@ class TestAggregator:
             'source_files': self.source_files,
             'last_updated': datetime.now().isoformat()
         }
-    
+        return self._summary_cache
+
     def _get_recent_results(self, hours: int = 24) -> List[TestResult]:
         """Get test results from the last N hours"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
@@ -302,7 +314,8 @@ class TestAggregator:
     
     def get_slowest_tests(self, limit: int = 10) -> List[TestResult]:
         """Get slowest performing tests"""
-        return sorted(self.results, key=lambda x: x.duration, reverse=True)[:limit]
+        # Heap select is O(N log limit) versus sorting the whole list
+        return heapq.nlargest(limit, self.results, key=lambda x: x.duration)
     
     def get_test_duration_stats(self) -> Dict[str, float]:
         """Get test duration statistics"""
@@ -311,11 +324,13 @@ class TestAggregator:
         
         durations = [result.duration for result in self.results]
         durations.sort()
-        
+
+        # The sorted list already holds min, max and median at known
+        # positions - no separate min()/max() passes
         total = sum(durations)
         avg = total / len(durations)
-        minimum = min(durations)
-        maximum = max(durations)
+        minimum = durations[0]
+        maximum = durations[-1]
         median = durations[len(durations) // 2]
         
         return {
@@ -420,3 +435,4 @@ class TestAggregator:
         self.results.clear()
         self.source_files.clear()
         self.aggregation_metadata.clear()
+        self._summary_cache = None